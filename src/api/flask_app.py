@@ -1,76 +1,108 @@
-"""Flask API for receiving webhooks.
+"""ASGI API for receiving webhooks.
 
 Provides HTTP endpoints for webhook integrations.
 """
 
-from flask import Flask, request, jsonify
+from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
 import os
 
-from ..github.webhook_handler import GitHubWebhookHandler
-from ..event_bus.publisher import ConsolePublisher, MultiPublisher, HTTPPublisher
+from ..github.webhook_handler import (
+    GitHubWebhookHandler,
+    MAX_PAYLOAD_SIZE,
+    PayloadTooLargeError
+)
+from ..event_bus.schema import EVENT_TYPE_VALUES
+from ..event_bus.tasks import publish_event, queue_for
+
 
+app = FastAPI(default_response_class=ORJSONResponse)
 
-app = Flask(__name__)
+# Refuse to start without a real secret; a guessable default lets anyone sign payloads
+if not os.getenv('GITHUB_WEBHOOK_SECRET'):
+    raise RuntimeError("GITHUB_WEBHOOK_SECRET must be set")
 
-# Initialize handlers and publishers
+# Initialize handlers
 github_handler = GitHubWebhookHandler(
-    secret=os.getenv('GITHUB_WEBHOOK_SECRET', 'your-secret-here')
+    secret=os.getenv('GITHUB_WEBHOOK_SECRET')
 )
 
-# Configure publishers
-publishers = [ConsolePublisher()]
-
-# Add HTTP publisher if configured
-if os.getenv('EVENT_BUS_ENDPOINT'):
-    publishers.append(HTTPPublisher(
-        endpoint_url=os.getenv('EVENT_BUS_ENDPOINT'),
-        headers={'Authorization': f"Bearer {os.getenv('EVENT_BUS_TOKEN')}"}
-    ))
 
-event_publisher = MultiPublisher(publishers)
+def payload_too_large() -> ORJSONResponse:
+    """Response for bodies over GitHub's webhook size limit."""
+    return ORJSONResponse({'status': 'error', 'message': 'Payload too large'}, status_code=413)
 
 
-@app.route('/health', methods=['GET'])
-def health():
+@app.get('/health')
+async def health():
     """Health check endpoint."""
-    return jsonify({'status': 'healthy'}), 200
+    return {'status': 'healthy'}
 
 
-@app.route('/webhooks/github', methods=['POST'])
-def github_webhook():
+@app.post('/webhooks/github')
+async def github_webhook(request: Request):
     """Handle GitHub webhook events."""
     try:
+        # Reject oversize payloads before reading them
+        content_length = request.headers.get('Content-Length', '')
+        if content_length.isdigit() and int(content_length) > MAX_PAYLOAD_SIZE:
+            return payload_too_large()
+
+        # Sign the body as it streams in so it is hashed while still in cache
+        hasher = github_handler.signature_hasher()
+        body = bytearray()
+        async for chunk in request.stream():
+            hasher.update(chunk)
+            body += chunk
+            if len(body) > MAX_PAYLOAD_SIZE:
+                return payload_too_large()
+
+        # Verify the streamed digest before touching the payload
+        headers = request.headers
+        if not github_handler.verify_digest(hasher.digest(), headers.get('X-Hub-Signature-256', '')):
+            raise ValueError("Invalid webhook signature")
+
         # Process webhook
-        event = github_handler.handle_request(
-            headers=dict(request.headers),
-            body=request.get_data()
+        event = github_handler.parse_and_map(
+            headers.get('X-GitHub-Event'),
+            headers.get('X-GitHub-Delivery'),
+            body
         )
-        
+
         if not event:
-            return jsonify({'status': 'ignored', 'message': 'Event type not supported'}), 200
-        
-        # Publish event
-        success = event_publisher.publish(event)
-        
-        if success:
-            return jsonify({
-                'status': 'success',
-                'event_id': event.id,
-                'event_type': event.type.value
-            }), 200
-        else:
-            return jsonify({
-                'status': 'error',
-                'message': 'Failed to publish event'
-            }), 500
-            
+            return {'status': 'ignored', 'message': 'Event type not supported'}
+
+        # Hand the event to a worker; publishing happens off the request path.
+        # The broker call blocks, so keep it off the event loop.
+        await run_in_threadpool(
+            publish_event.apply_async,
+            args=[event.to_dict()],
+            queue=queue_for(event.type)
+        )
+
+        return {
+            'status': 'queued',
+            'event_id': event.id,
+            'event_type': EVENT_TYPE_VALUES[event.type]
+        }
+
+    except PayloadTooLargeError:
+        return payload_too_large()
     except ValueError as e:
-        return jsonify({'status': 'error', 'message': str(e)}), 401
+        return ORJSONResponse({'status': 'error', 'message': str(e)}, status_code=401)
     except Exception as e:
         print(f"Error processing webhook: {e}")
-        return jsonify({'status': 'error', 'message': 'Internal server error'}), 500
+        return ORJSONResponse({'status': 'error', 'message': 'Internal server error'}, status_code=500)
 
 
 if __name__ == '__main__':
+    import uvicorn
+
     port = int(os.getenv('PORT', 5000))
-    app.run(host='0.0.0.0', port=port, debug=os.getenv('DEBUG', 'false').lower() == 'true')
+    uvicorn.run(
+        'src.api.flask_app:app',
+        host='0.0.0.0',
+        port=port,
+        reload=os.getenv('DEBUG', 'false').lower() == 'true'
+    )
@@ -3,18 +3,25 @@
 Publishes standardized events to various targets (message queue, HTTP endpoint, etc.).
 """
 
-import json
+import asyncio
+import logging
 from typing import Optional, List
 from abc import ABC, abstractmethod
 
-from .schema import StandardEvent
+import httpx
+import msgspec
+
+from .schema import StandardEvent, EVENT_TYPE_VALUES
+
+
+logger = logging.getLogger(__name__)
 
 
 class EventPublisher(ABC):
     """Base class for event publishers."""
     
     @abstractmethod
-    def publish(self, event: StandardEvent) -> bool:
+    async def publish(self, event: StandardEvent) -> bool:
         """Publish event to target.
         
         Args:
@@ -27,50 +34,80 @@ class EventPublisher(ABC):
 
 
 class ConsolePublisher(EventPublisher):
-    """Publishes events to console (for testing/debugging)."""
+    """Logs events for debugging (emitted only when DEBUG logging is enabled)."""
     
-    def publish(self, event: StandardEvent) -> bool:
-        """Print event to console."""
-        print("=" * 80)
-        print(f"Event: {event.type.value}")
-        print(f"Source: {event.source}")
-        print(f"Actor: {event.actor.username}")
-        print(f"Repository: {event.repository.full_name}")
-        print(f"Timestamp: {event.timestamp}")
-        print("-" * 80)
-        print(json.dumps(event.to_dict(), indent=2))
-        print("=" * 80)
+    async def publish(self, event: StandardEvent) -> bool:
+        """Log event at DEBUG level."""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Event %s (%s) from %s by %s on %s at %s: %s",
+                event.id,
+                EVENT_TYPE_VALUES[event.type],
+                event.source,
+                event.actor.username,
+                event.repository.full_name,
+                event.timestamp,
+                msgspec.json.encode(event).decode()
+            )
         return True
 
 
 class HTTPPublisher(EventPublisher):
     """Publishes events to HTTP endpoint."""
     
-    def __init__(self, endpoint_url: str, headers: Optional[dict] = None):
+    # Gateway errors worth retrying with backoff
+    RETRY_STATUSES = frozenset({502, 503, 504})
+    
+    def __init__(self,
+                 endpoint_url: str,
+                 headers: Optional[dict] = None,
+                 max_retries: int = 3,
+                 backoff_factor: float = 0.2,
+                 transport: Optional[httpx.AsyncBaseTransport] = None):
         """Initialize HTTP publisher.
         
         Args:
             endpoint_url: Target HTTP endpoint
             headers: Optional headers to include
+            max_retries: Retries for connection failures and gateway errors
+            backoff_factor: Base delay in seconds between status retries
+            transport: Optional transport override (defaults to a pooled
+                HTTP/2 transport with connection retries)
         """
         self.endpoint_url = endpoint_url
-        self.headers = headers or {'Content-Type': 'application/json'}
+        self.headers = {'Content-Type': 'application/json', **(headers or {})}
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        
+        if transport is None:
+            transport = httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_connections=50, max_keepalive_connections=10),
+                retries=max_retries
+            )
+        
+        # Persistent client: keep-alive connections are reused across events
+        self.client = httpx.AsyncClient(timeout=10, transport=transport)
     
-    def publish(self, event: StandardEvent) -> bool:
+    async def publish(self, event: StandardEvent) -> bool:
         """POST event to HTTP endpoint."""
-        import requests
+        data = msgspec.json.encode(event)
         
         try:
-            response = requests.post(
-                self.endpoint_url,
-                json=event.to_dict(),
-                headers=self.headers,
-                timeout=10
-            )
+            for attempt in range(self.max_retries + 1):
+                response = await self.client.post(
+                    self.endpoint_url,
+                    content=data,
+                    headers=self.headers
+                )
+                if response.status_code not in self.RETRY_STATUSES or attempt == self.max_retries:
+                    break
+                await asyncio.sleep(self.backoff_factor * (2 ** attempt))
+            
             response.raise_for_status()
             return True
-        except requests.RequestException as e:
-            print(f"Failed to publish event: {e}")
+        except httpx.HTTPError as e:
+            logger.warning("Failed to publish event %s: %s", event.id, e)
             return False
 
 
@@ -86,7 +123,7 @@ class MessageQueuePublisher(EventPublisher):
         self.queue_config = queue_config
         # Implementation depends on specific message queue
     
-    def publish(self, event: StandardEvent) -> bool:
+    async def publish(self, event: StandardEvent) -> bool:
         """Publish event to message queue."""
         # Placeholder - implement based on specific queue
         raise NotImplementedError("Message queue publishing not yet implemented")
@@ -103,7 +140,22 @@ class MultiPublisher(EventPublisher):
         """
         self.publishers = publishers
     
-    def publish(self, event: StandardEvent) -> bool:
-        """Publish to all configured publishers."""
-        results = [publisher.publish(event) for publisher in self.publishers]
-        return all(results)
+    async def publish(self, event: StandardEvent) -> bool:
+        """Publish to all configured publishers concurrently.
+        
+        A publisher that raises counts as a failure; the others still run to
+        completion.
+        """
+        results = await asyncio.gather(
+            *(publisher.publish(event) for publisher in self.publishers),
+            return_exceptions=True
+        )
+        for publisher, result in zip(self.publishers, results):
+            if isinstance(result, BaseException):
+                logger.error(
+                    "%s failed to publish event %s",
+                    type(publisher).__name__,
+                    event.id,
+                    exc_info=result
+                )
+        return all(result is True for result in results)
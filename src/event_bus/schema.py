@@ -3,10 +3,10 @@
 Defines the common event format used across all integrations.
 """
 
-from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Sequence
 from enum import Enum
-from datetime import datetime
+
+import msgspec
 
 
 class EventType(Enum):
@@ -43,6 +43,10 @@ class EventType(Enum):
     DEPLOYMENT_FAILED = "deployment.failed"
 
 
+# EventType member -> value, skipping Enum's descriptor lookup on hot paths
+EVENT_TYPE_VALUES = {member: member.value for member in EventType}
+
+
 class ChangeType(Enum):
     """Types of changes that can occur."""
     COMMIT = "commit"
@@ -51,8 +55,10 @@ class ChangeType(Enum):
     FILE_DELETE = "file.delete"
 
 
-@dataclass
-class Actor:
+# Actor and Repository hold only strings, so they can never be part of a
+# reference cycle; gc=False skips GC tracking for them. Structs holding
+# lists or dicts stay tracked.
+class Actor(msgspec.Struct, gc=False):
     """Person or system that triggered the event."""
     id: str
     username: str
@@ -61,8 +67,7 @@ class Actor:
     avatar_url: Optional[str] = None
 
 
-@dataclass
-class Repository:
+class Repository(msgspec.Struct, gc=False):
     """Repository information."""
     id: str
     name: str
@@ -72,21 +77,19 @@ class Repository:
     default_branch: str = "main"
 
 
-@dataclass
-class Change:
+class Change(msgspec.Struct):
     """Represents a single change (commit, file change, etc.)."""
     type: ChangeType
     id: str
     message: Optional[str] = None
     timestamp: Optional[str] = None
     author: Optional[Actor] = None
-    files_added: List[str] = field(default_factory=list)
-    files_modified: List[str] = field(default_factory=list)
-    files_removed: List[str] = field(default_factory=list)
+    files_added: Sequence[str] = ()
+    files_modified: Sequence[str] = ()
+    files_removed: Sequence[str] = ()
 
 
-@dataclass
-class EventMetadata:
+class EventMetadata(msgspec.Struct):
     """Flexible metadata container for event-specific data."""
     # Git/Branch metadata
     ref: Optional[str] = None
@@ -137,15 +140,14 @@ class EventMetadata:
     
     # Common metadata
     action: Optional[str] = None
-    labels: List[str] = field(default_factory=list)
-    assignees: List[str] = field(default_factory=list)
+    labels: List[str] = msgspec.field(default_factory=list)
+    assignees: List[str] = msgspec.field(default_factory=list)
     
     # Custom metadata
-    custom: Dict[str, Any] = field(default_factory=dict)
+    custom: Dict[str, Any] = msgspec.field(default_factory=dict)
 
 
-@dataclass
-class StandardEvent:
+class StandardEvent(msgspec.Struct):
     """Standardized event format used across all integrations."""
     id: str  # Unique event ID
     type: EventType  # Event type
@@ -154,19 +156,9 @@ class StandardEvent:
     actor: Actor  # Who triggered the event
     repository: Repository  # Repository info
     metadata: EventMetadata  # Event-specific metadata
-    changes: List[Change] = field(default_factory=list)  # List of changes
-    raw_payload: Dict[str, Any] = field(default_factory=dict)  # Original payload
+    changes: List[Change] = msgspec.field(default_factory=list)  # List of changes
+    raw_payload: Dict[str, Any] = msgspec.field(default_factory=dict)  # Original payload
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert event to dictionary."""
-        return {
-            'id': self.id,
-            'type': self.type.value,
-            'source': self.source,
-            'timestamp': self.timestamp,
-            'actor': self.actor.__dict__,
-            'repository': self.repository.__dict__,
-            'metadata': self.metadata.__dict__,
-            'changes': [change.__dict__ for change in self.changes],
-            'raw_payload': self.raw_payload
-        }
+        """Convert event to dictionary of JSON-compatible builtins."""
+        return msgspec.to_builtins(self)
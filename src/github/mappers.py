@@ -3,8 +3,10 @@
 Maps GitHub webhook payloads to standardized event schema.
 """
 
+import os
+from operator import itemgetter
 from typing import Dict, Any, List
-from datetime import datetime
+from datetime import datetime, timezone
 
 from ..event_bus.schema import (
     StandardEvent,
@@ -17,6 +19,39 @@ from ..event_bus.schema import (
 )
 
 
+# C-level field getters for list-of-dicts extraction (labels, assignees)
+_get_name = itemgetter('name')
+_get_login = itemgetter('login')
+
+# Echo the original GitHub payload in StandardEvent.raw_payload (off by default,
+# since it roughly doubles the size of every published event)
+INCLUDE_RAW_PAYLOAD = os.getenv('EVENT_BUS_INCLUDE_RAW_PAYLOAD', 'false').lower() == 'true'
+
+# GitHub action -> standard event type, built once at import
+_PR_ACTION_TO_TYPE = {
+    'opened': EventType.PR_OPENED,
+    'closed': EventType.PR_CLOSED,
+    'reopened': EventType.PR_REOPENED,
+    'synchronize': EventType.PR_UPDATED,
+    'edited': EventType.PR_UPDATED,
+    'review_requested': EventType.PR_REVIEW_REQUESTED,
+}
+
+_ISSUE_ACTION_TO_TYPE = {
+    'opened': EventType.ISSUE_OPENED,
+    'closed': EventType.ISSUE_CLOSED,
+    'reopened': EventType.ISSUE_REOPENED,
+    'edited': EventType.ISSUE_UPDATED,
+    'assigned': EventType.ISSUE_UPDATED,
+    'labeled': EventType.ISSUE_UPDATED,
+}
+
+
+def utc_timestamp() -> str:
+    """Return the current UTC time as an ISO 8601 string (e.g. 2026-02-27T21:54:00.123456Z)."""
+    return datetime.now(timezone.utc).isoformat(timespec='microseconds').replace('+00:00', 'Z')
+
+
 def extract_actor(user_data: Dict[str, Any]) -> Actor:
     """Extract actor information from GitHub user data."""
     return Actor(
@@ -40,7 +75,7 @@ def extract_repository(repo_data: Dict[str, Any]) -> Repository:
     )
 
 
-def map_push_event(payload: Dict[str, Any], delivery_id: str) -> StandardEvent:
+def map_push_event(payload: Dict[str, Any], delivery_id: str, now_iso: str) -> StandardEvent:
     """Map GitHub push event to standard event."""
     commits = payload.get('commits', [])
     
@@ -57,16 +92,16 @@ def map_push_event(payload: Dict[str, Any], delivery_id: str) -> StandardEvent:
                 name=commit['author']['name'],
                 email=commit['author']['email']
             ),
-            files_added=commit.get('added', []),
-            files_modified=commit.get('modified', []),
-            files_removed=commit.get('removed', [])
+            files_added=commit.get('added') or (),
+            files_modified=commit.get('modified') or (),
+            files_removed=commit.get('removed') or ()
         ))
     
     return StandardEvent(
         id=delivery_id,
         type=EventType.CODE_PUSH,
         source='github',
-        timestamp=datetime.utcnow().isoformat(),
+        timestamp=now_iso,
         actor=extract_actor(payload['pusher']),
         repository=extract_repository(payload['repository']),
         metadata=EventMetadata(
@@ -80,32 +115,26 @@ def map_push_event(payload: Dict[str, Any], delivery_id: str) -> StandardEvent:
             compare_url=payload.get('compare')
         ),
         changes=changes,
-        raw_payload=payload
+        raw_payload=payload if INCLUDE_RAW_PAYLOAD else {}
     )
 
 
-def map_pull_request_event(payload: Dict[str, Any], delivery_id: str) -> StandardEvent:
+def map_pull_request_event(payload: Dict[str, Any], delivery_id: str, now_iso: str) -> StandardEvent:
     """Map GitHub pull request event to standard event."""
     pr = payload['pull_request']
     action = payload['action']
     
     # Determine event type based on action
-    event_type_map = {
-        'opened': EventType.PR_OPENED,
-        'closed': EventType.PR_MERGED if pr.get('merged') else EventType.PR_CLOSED,
-        'reopened': EventType.PR_REOPENED,
-        'synchronize': EventType.PR_UPDATED,
-        'edited': EventType.PR_UPDATED,
-        'review_requested': EventType.PR_REVIEW_REQUESTED,
-    }
-    
-    event_type = event_type_map.get(action, EventType.PR_UPDATED)
+    if action == 'closed' and pr.get('merged'):
+        event_type = EventType.PR_MERGED
+    else:
+        event_type = _PR_ACTION_TO_TYPE.get(action, EventType.PR_UPDATED)
     
     return StandardEvent(
         id=delivery_id,
         type=event_type,
         source='github',
-        timestamp=datetime.utcnow().isoformat(),
+        timestamp=now_iso,
         actor=extract_actor(payload['sender']),
         repository=extract_repository(payload['repository']),
         metadata=EventMetadata(
@@ -119,33 +148,24 @@ def map_pull_request_event(payload: Dict[str, Any], delivery_id: str) -> Standar
             pr_head_ref=pr['head']['ref'],
             pr_author=pr['user']['login'],
             action=action,
-            labels=[label['name'] for label in pr.get('labels', [])]
+            labels=list(map(_get_name, pr.get('labels') or ()))
         ),
-        raw_payload=payload
+        raw_payload=payload if INCLUDE_RAW_PAYLOAD else {}
     )
 
 
-def map_issue_event(payload: Dict[str, Any], delivery_id: str) -> StandardEvent:
+def map_issue_event(payload: Dict[str, Any], delivery_id: str, now_iso: str) -> StandardEvent:
     """Map GitHub issue event to standard event."""
     issue = payload['issue']
     action = payload['action']
     
-    event_type_map = {
-        'opened': EventType.ISSUE_OPENED,
-        'closed': EventType.ISSUE_CLOSED,
-        'reopened': EventType.ISSUE_REOPENED,
-        'edited': EventType.ISSUE_UPDATED,
-        'assigned': EventType.ISSUE_UPDATED,
-        'labeled': EventType.ISSUE_UPDATED,
-    }
-    
-    event_type = event_type_map.get(action, EventType.ISSUE_UPDATED)
+    event_type = _ISSUE_ACTION_TO_TYPE.get(action, EventType.ISSUE_UPDATED)
     
     return StandardEvent(
         id=delivery_id,
         type=event_type,
         source='github',
-        timestamp=datetime.utcnow().isoformat(),
+        timestamp=now_iso,
         actor=extract_actor(payload['sender']),
         repository=extract_repository(payload['repository']),
         metadata=EventMetadata(
@@ -155,14 +175,14 @@ def map_issue_event(payload: Dict[str, Any], delivery_id: str) -> StandardEvent:
             issue_url=issue['html_url'],
             issue_author=issue['user']['login'],
             action=action,
-            labels=[label['name'] for label in issue.get('labels', [])],
-            assignees=[assignee['login'] for assignee in issue.get('assignees', [])]
+            labels=list(map(_get_name, issue.get('labels') or ())),
+            assignees=list(map(_get_login, issue.get('assignees') or ()))
         ),
-        raw_payload=payload
+        raw_payload=payload if INCLUDE_RAW_PAYLOAD else {}
     )
 
 
-def map_issue_comment_event(payload: Dict[str, Any], delivery_id: str) -> StandardEvent:
+def map_issue_comment_event(payload: Dict[str, Any], delivery_id: str, now_iso: str) -> StandardEvent:
     """Map GitHub issue comment event to standard event."""
     comment = payload['comment']
     issue = payload['issue']
@@ -175,7 +195,7 @@ def map_issue_comment_event(payload: Dict[str, Any], delivery_id: str) -> Standa
         id=delivery_id,
         type=event_type,
         source='github',
-        timestamp=datetime.utcnow().isoformat(),
+        timestamp=now_iso,
         actor=extract_actor(payload['sender']),
         repository=extract_repository(payload['repository']),
         metadata=EventMetadata(
@@ -186,11 +206,11 @@ def map_issue_comment_event(payload: Dict[str, Any], delivery_id: str) -> Standa
             issue_title=issue['title'],
             action=payload['action']
         ),
-        raw_payload=payload
+        raw_payload=payload if INCLUDE_RAW_PAYLOAD else {}
     )
 
 
-def map_pull_request_review_event(payload: Dict[str, Any], delivery_id: str) -> StandardEvent:
+def map_pull_request_review_event(payload: Dict[str, Any], delivery_id: str, now_iso: str) -> StandardEvent:
     """Map GitHub pull request review event to standard event."""
     review = payload['review']
     pr = payload['pull_request']
@@ -199,7 +219,7 @@ def map_pull_request_review_event(payload: Dict[str, Any], delivery_id: str) ->
         id=delivery_id,
         type=EventType.PR_REVIEWED,
         source='github',
-        timestamp=datetime.utcnow().isoformat(),
+        timestamp=now_iso,
         actor=extract_actor(payload['sender']),
         repository=extract_repository(payload['repository']),
         metadata=EventMetadata(
@@ -211,11 +231,11 @@ def map_pull_request_review_event(payload: Dict[str, Any], delivery_id: str) ->
             pr_title=pr['title'],
             action=payload['action']
         ),
-        raw_payload=payload
+        raw_payload=payload if INCLUDE_RAW_PAYLOAD else {}
     )
 
 
-def map_release_event(payload: Dict[str, Any], delivery_id: str) -> StandardEvent:
+def map_release_event(payload: Dict[str, Any], delivery_id: str, now_iso: str) -> StandardEvent:
     """Map GitHub release event to standard event."""
     release = payload['release']
     
@@ -223,7 +243,7 @@ def map_release_event(payload: Dict[str, Any], delivery_id: str) -> StandardEven
         id=delivery_id,
         type=EventType.RELEASE_PUBLISHED,
         source='github',
-        timestamp=datetime.utcnow().isoformat(),
+        timestamp=now_iso,
         actor=extract_actor(payload['sender']),
         repository=extract_repository(payload['repository']),
         metadata=EventMetadata(
@@ -235,5 +255,5 @@ def map_release_event(payload: Dict[str, Any], delivery_id: str) -> StandardEven
             release_prerelease=release['prerelease'],
             action=payload['action']
         ),
-        raw_payload=payload
+        raw_payload=payload if INCLUDE_RAW_PAYLOAD else {}
     )
@@ -3,15 +3,14 @@
 Processes GitHub webhook payloads and transforms them into standardized events.
 """
 
-import hashlib
 import hmac
-import json
-from typing import Dict, Any, Optional
-from datetime import datetime
+from typing import Dict, Any, Optional, Union
+
+import orjson
 
 from ..event_bus.schema import StandardEvent, EventType, EventMetadata
 from .mappers import (
-    map_commit_event,
+    utc_timestamp,
     map_pull_request_event,
     map_issue_event,
     map_push_event,
@@ -21,6 +20,28 @@ from .mappers import (
 )
 
 
+# Raw request bodies are accepted as any contiguous bytes buffer
+Buffer = Union[bytes, bytearray, memoryview]
+
+# GitHub caps webhook payloads at 25 MB; anything larger is not from GitHub
+MAX_PAYLOAD_SIZE = 25 * 1024 * 1024
+
+
+class PayloadTooLargeError(ValueError):
+    """Raised when a webhook body exceeds MAX_PAYLOAD_SIZE."""
+
+
+# GitHub event type (X-GitHub-Event) -> mapper
+EVENT_MAPPERS = {
+    'push': map_push_event,
+    'pull_request': map_pull_request_event,
+    'issues': map_issue_event,
+    'issue_comment': map_issue_comment_event,
+    'pull_request_review': map_pull_request_review_event,
+    'release': map_release_event,
+}
+
+
 class GitHubWebhookHandler:
     """Handles incoming GitHub webhook events."""
     
@@ -29,39 +50,55 @@ class GitHubWebhookHandler:
         
         Args:
             secret: GitHub webhook secret for signature verification
+            
+        Raises:
+            ValueError: If secret is empty
         """
+        if not secret:
+            raise ValueError("GitHub webhook secret must not be empty")
         self.secret = secret.encode('utf-8')
-        self.event_mappers = {
-            'push': map_push_event,
-            'pull_request': map_pull_request_event,
-            'issues': map_issue_event,
-            'issue_comment': map_issue_comment_event,
-            'pull_request_review': map_pull_request_review_event,
-            'release': map_release_event,
-        }
     
-    def verify_signature(self, payload: bytes, signature: str) -> bool:
+    def signature_hasher(self) -> 'hmac.HMAC':
+        """Create an incremental HMAC-SHA256 for a body read in chunks.
+        
+        Feed each chunk with ``update()`` while buffering it, check
+        ``digest()`` with ``verify_digest`` and only then hand the buffered
+        body to ``parse_and_map``, so the body is only walked once before
+        parsing.
+        """
+        return hmac.new(self.secret, digestmod='sha256')
+    
+    def verify_signature(self, payload: Buffer, signature: str) -> bool:
         """Verify GitHub webhook signature.
         
         Args:
             payload: Raw request body
             signature: X-Hub-Signature-256 header value
             
+        Returns:
+            True if signature is valid, False otherwise
+        """
+        return self.verify_digest(hmac.digest(self.secret, payload, 'sha256'), signature)
+    
+    def verify_digest(self, expected_digest: bytes, signature: str) -> bool:
+        """Verify GitHub webhook signature against a precomputed HMAC digest.
+        
+        Args:
+            expected_digest: HMAC-SHA256 digest of the raw request body
+            signature: X-Hub-Signature-256 header value
+            
         Returns:
             True if signature is valid, False otherwise
         """
         if not signature or not signature.startswith('sha256='):
             return False
         
-        expected_signature = hmac.new(
-            self.secret,
-            payload,
-            hashlib.sha256
-        ).hexdigest()
-        
-        received_signature = signature[7:]  # Remove 'sha256=' prefix
+        try:
+            received_digest = bytes.fromhex(signature[7:])  # Remove 'sha256=' prefix
+        except ValueError:
+            return False
         
-        return hmac.compare_digest(expected_signature, received_signature)
+        return hmac.compare_digest(expected_digest, received_digest)
     
     def process_webhook(self, 
                        event_type: str, 
@@ -77,47 +114,77 @@ class GitHubWebhookHandler:
         Returns:
             StandardEvent or None if event type is not supported
         """
-        mapper = self.event_mappers.get(event_type)
+        mapper = EVENT_MAPPERS.get(event_type)
         
         if not mapper:
             print(f"Unsupported event type: {event_type}")
             return None
         
+        # Event timestamp, computed once per delivery
+        now_iso = utc_timestamp()
+        
         try:
-            standard_event = mapper(payload, delivery_id)
+            standard_event = mapper(payload, delivery_id, now_iso)
             return standard_event
         except Exception as e:
             print(f"Error mapping {event_type} event: {e}")
             raise
     
+    def parse_and_map(self,
+                      event_type: Optional[str],
+                      delivery_id: Optional[str],
+                      body: Buffer) -> Optional[StandardEvent]:
+        """Parse a verified webhook body and convert it to a standard event.
+        
+        The caller must already have verified the body's signature.
+        
+        Args:
+            event_type: GitHub event type (X-GitHub-Event header)
+            delivery_id: GitHub delivery ID (X-GitHub-Delivery header)
+            body: Raw request body (bytes, bytearray or memoryview)
+            
+        Returns:
+            StandardEvent or None
+            
+        Raises:
+            ValueError: If required headers are missing
+        """
+        if not event_type or not delivery_id:
+            raise ValueError("Missing required headers")
+        
+        # Parse payload
+        payload = orjson.loads(body)
+        
+        return self.process_webhook(event_type, payload, delivery_id)
+    
     def handle_request(self,
-                      headers: Dict[str, str],
-                      body: bytes) -> Optional[StandardEvent]:
+                      signature: Optional[str],
+                      event_type: Optional[str],
+                      delivery_id: Optional[str],
+                      body: Buffer) -> Optional[StandardEvent]:
         """Handle complete webhook request.
         
         Args:
-            headers: Request headers
-            body: Raw request body
+            signature: X-Hub-Signature-256 header value
+            event_type: GitHub event type (X-GitHub-Event header)
+            delivery_id: GitHub delivery ID (X-GitHub-Delivery header)
+            body: Raw request body (bytes, bytearray or memoryview)
             
         Returns:
             StandardEvent or None
             
         Raises:
+            PayloadTooLargeError: If the payload exceeds MAX_PAYLOAD_SIZE
             ValueError: If signature verification fails
         """
+        if len(body) > MAX_PAYLOAD_SIZE:
+            raise PayloadTooLargeError("Payload too large")
+        
+        # Both HMAC and orjson read the buffer in place, without copying it
+        body = memoryview(body)
+        
         # Verify signature
-        signature = headers.get('X-Hub-Signature-256', '')
         if not self.verify_signature(body, signature):
             raise ValueError("Invalid webhook signature")
         
-        # Parse payload
-        payload = json.loads(body)
-        
-        # Get event type and delivery ID
-        event_type = headers.get('X-GitHub-Event')
-        delivery_id = headers.get('X-GitHub-Delivery')
-        
-        if not event_type or not delivery_id:
-            raise ValueError("Missing required headers")
-        
-        return self.process_webhook(event_type, payload, delivery_id)
+        return self.parse_and_map(event_type, delivery_id, body)
@@ -0,0 +1,91 @@
+"""Tests for the webhook API routes."""
+
+import hashlib
+import hmac
+import json
+import os
+from unittest import mock
+
+os.environ.setdefault('GITHUB_WEBHOOK_SECRET', 'test-secret')
+
+from fastapi.testclient import TestClient
+
+from src.api.flask_app import app, publish_event
+from src.github.webhook_handler import MAX_PAYLOAD_SIZE
+
+
+SECRET = os.environ['GITHUB_WEBHOOK_SECRET'].encode('utf-8')
+
+client = TestClient(app)
+
+BODY = json.dumps({
+    'action': 'opened',
+    'sender': {'id': 1, 'login': 'testuser'},
+    'repository': {
+        'id': 123,
+        'name': 'test-repo',
+        'full_name': 'testuser/test-repo',
+        'owner': {'login': 'testuser'},
+        'html_url': 'https://github.com/testuser/test-repo'
+    },
+    'issue': {
+        'number': 7,
+        'title': 'Bug report',
+        'state': 'open',
+        'html_url': 'https://github.com/testuser/test-repo/issues/7',
+        'user': {'login': 'testuser'},
+        'labels': [{'name': 'bug'}],
+        'assignees': []
+    }
+}).encode('utf-8')
+
+
+def github_headers(body, signature=None):
+    """Build GitHub webhook headers, signing body unless a signature is given."""
+    if signature is None:
+        signature = 'sha256=' + hmac.new(SECRET, body, hashlib.sha256).hexdigest()
+    return {
+        'X-Hub-Signature-256': signature,
+        'X-GitHub-Event': 'issues',
+        'X-GitHub-Delivery': 'test-delivery-id'
+    }
+
+
+def test_github_webhook_queues_event():
+    """Test that a signed webhook is queued and acknowledged."""
+    with mock.patch.object(publish_event, 'apply_async') as apply_async:
+        response = client.post('/webhooks/github', content=BODY, headers=github_headers(BODY))
+    
+    assert response.status_code == 200
+    assert response.json() == {
+        'status': 'queued',
+        'event_id': 'test-delivery-id',
+        'event_type': 'issue.opened'
+    }
+    apply_async.assert_called_once()
+    event_dict = apply_async.call_args.kwargs['args'][0]
+    assert event_dict['metadata']['labels'] == ['bug']
+
+
+def test_github_webhook_rejects_bad_signature():
+    """Test that an invalid signature is rejected without queueing."""
+    with mock.patch.object(publish_event, 'apply_async') as apply_async:
+        response = client.post(
+            '/webhooks/github',
+            content=BODY,
+            headers=github_headers(BODY, signature='sha256=' + '00' * 32)
+        )
+    
+    assert response.status_code == 401
+    apply_async.assert_not_called()
+
+
+def test_github_webhook_rejects_oversize_content_length():
+    """Test that an oversize Content-Length is rejected with 413."""
+    body = b' ' * (MAX_PAYLOAD_SIZE + 1)
+    
+    with mock.patch.object(publish_event, 'apply_async') as apply_async:
+        response = client.post('/webhooks/github', content=body, headers=github_headers(body))
+    
+    assert response.status_code == 413
+    apply_async.assert_not_called()
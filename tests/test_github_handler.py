@@ -1,7 +1,9 @@
 """Unit tests for GitHub webhook handler."""
 
 import json
+import re
 import pytest
+from src.github import mappers
 from src.github.webhook_handler import GitHubWebhookHandler
 from src.event_bus.schema import EventType
 
@@ -54,6 +56,7 @@ def test_push_event_mapping():
     assert event.repository.name == 'test-repo'
     assert len(event.changes) == 1
     assert event.metadata.ref == 'refs/heads/main'
+    assert re.fullmatch(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{6}Z', event.timestamp)
 
 
 def test_pull_request_opened():
@@ -97,6 +100,40 @@ def test_pull_request_opened():
     assert event.metadata.pr_state == 'open'
 
 
+def test_pull_request_closed_merged_and_unmerged():
+    """Test that closed PRs map to merged or closed based on merge state."""
+    handler = GitHubWebhookHandler(secret='test-secret')
+    
+    payload = {
+        'action': 'closed',
+        'sender': {'id': 1, 'login': 'testuser'},
+        'repository': {
+            'id': 123,
+            'name': 'test-repo',
+            'full_name': 'testuser/test-repo',
+            'owner': {'login': 'testuser'},
+            'html_url': 'https://github.com/testuser/test-repo'
+        },
+        'pull_request': {
+            'number': 42,
+            'title': 'Add new feature',
+            'state': 'closed',
+            'html_url': 'https://github.com/testuser/test-repo/pull/42',
+            'merged': True,
+            'user': {'login': 'testuser'},
+            'base': {'ref': 'main'},
+            'head': {'ref': 'feature-branch'}
+        }
+    }
+    
+    event = handler.process_webhook('pull_request', payload, 'test-delivery-id')
+    assert event.type == EventType.PR_MERGED
+    
+    payload['pull_request']['merged'] = False
+    event = handler.process_webhook('pull_request', payload, 'test-delivery-id')
+    assert event.type == EventType.PR_CLOSED
+
+
 def test_signature_verification():
     """Test webhook signature verification."""
     import hmac
@@ -119,3 +156,103 @@ def test_signature_verification():
     # Test invalid signature
     assert handler.verify_signature(payload, 'sha256=invalid') == False
     assert handler.verify_signature(payload, '') == False
+    assert handler.verify_signature(payload, 'sha256=' + 'ab' * 31) == False
+    assert handler.verify_signature(payload, 'sha1=' + signature[7:]) == False
+
+
+def test_streamed_digest_then_parse():
+    """Test verifying a body hashed incrementally while it was read."""
+    handler = GitHubWebhookHandler(secret='test-secret')
+    
+    body = json.dumps({
+        'action': 'published',
+        'sender': {'id': 1, 'login': 'testuser'},
+        'repository': {
+            'id': 123,
+            'name': 'test-repo',
+            'full_name': 'testuser/test-repo',
+            'owner': {'login': 'testuser'},
+            'html_url': 'https://github.com/testuser/test-repo'
+        },
+        'release': {
+            'id': 7,
+            'name': 'v1.0.0',
+            'tag_name': 'v1.0.0',
+            'html_url': 'https://github.com/testuser/test-repo/releases/v1.0.0',
+            'draft': False,
+            'prerelease': False
+        }
+    }).encode('utf-8')
+    
+    hasher = handler.signature_hasher()
+    buffered = bytearray()
+    for i in range(0, len(body), 16):
+        hasher.update(body[i:i + 16])
+        buffered += body[i:i + 16]
+    
+    signature = 'sha256=' + hasher.hexdigest()
+    
+    assert handler.verify_digest(hasher.digest(), signature)
+    event = handler.parse_and_map('release', 'test-delivery-id', buffered)
+    
+    assert event.type == EventType.RELEASE_PUBLISHED
+    assert event.metadata.release_tag == 'v1.0.0'
+    
+    # handle_request signs the body it is given
+    event = handler.handle_request(signature, 'release', 'test-delivery-id', body)
+    assert event.id == 'test-delivery-id'
+    
+    # A signature for different bytes must not authenticate this body
+    tampered = body.replace(b'v1.0.0', b'v6.6.6')
+    assert not handler.verify_digest(handler.signature_hasher().digest(), signature)
+    with pytest.raises(ValueError, match='Invalid webhook signature'):
+        handler.handle_request(signature, 'release', 'test-delivery-id', tampered)
+
+
+def test_handle_request_rejects_oversize_payload():
+    """Test that payloads over GitHub's size limit are rejected before parsing."""
+    from src.github.webhook_handler import MAX_PAYLOAD_SIZE, PayloadTooLargeError
+    
+    handler = GitHubWebhookHandler(secret='test-secret')
+    body = b'[' * (MAX_PAYLOAD_SIZE + 1)
+    
+    with pytest.raises(PayloadTooLargeError):
+        handler.handle_request('sha256=00', 'push', 'test-delivery-id', body)
+
+
+def test_empty_secret_rejected():
+    """Test that the handler refuses to run without a webhook secret."""
+    with pytest.raises(ValueError):
+        GitHubWebhookHandler(secret='')
+
+
+def test_raw_payload_is_opt_in(monkeypatch):
+    """Test that the original payload is only echoed when enabled."""
+    handler = GitHubWebhookHandler(secret='test-secret')
+    
+    payload = {
+        'action': 'published',
+        'sender': {'id': 1, 'login': 'testuser'},
+        'repository': {
+            'id': 123,
+            'name': 'test-repo',
+            'full_name': 'testuser/test-repo',
+            'owner': {'login': 'testuser'},
+            'html_url': 'https://github.com/testuser/test-repo'
+        },
+        'release': {
+            'id': 7,
+            'name': 'v1.0.0',
+            'tag_name': 'v1.0.0',
+            'html_url': 'https://github.com/testuser/test-repo/releases/v1.0.0',
+            'draft': False,
+            'prerelease': False
+        }
+    }
+    
+    event = handler.process_webhook('release', payload, 'test-delivery-id')
+    assert event.raw_payload == {}
+    
+    monkeypatch.setattr(mappers, 'INCLUDE_RAW_PAYLOAD', True)
+    event = handler.process_webhook('release', payload, 'test-delivery-id')
+    assert event.raw_payload == payload
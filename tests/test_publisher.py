@@ -0,0 +1,108 @@
+"""Unit tests for event publishers."""
+
+import asyncio
+import time
+
+import httpx
+
+from src.event_bus.publisher import EventPublisher, HTTPPublisher, MultiPublisher
+from src.event_bus.schema import (
+    StandardEvent,
+    EventType,
+    EventMetadata,
+    Actor,
+    Repository
+)
+
+
+def make_event():
+    """Build a minimal StandardEvent."""
+    return StandardEvent(
+        id='test-delivery-id',
+        type=EventType.PR_OPENED,
+        source='github',
+        timestamp='2026-02-27T21:54:00Z',
+        actor=Actor(id='1', username='testuser'),
+        repository=Repository(
+            id='123',
+            name='test-repo',
+            full_name='testuser/test-repo',
+            owner='testuser',
+            url='https://github.com/testuser/test-repo'
+        ),
+        metadata=EventMetadata(pr_number=42)
+    )
+
+
+class SleepingPublisher(EventPublisher):
+    """Publisher that waits before reporting a fixed result."""
+    
+    def __init__(self, delay, result=True):
+        self.delay = delay
+        self.result = result
+    
+    async def publish(self, event):
+        await asyncio.sleep(self.delay)
+        return self.result
+
+
+def make_publisher(statuses, requests):
+    """Build an HTTPPublisher whose endpoint answers with the given statuses."""
+    responses = iter(statuses)
+    
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(next(responses))
+    
+    return HTTPPublisher(
+        endpoint_url='https://bus.example.com/events',
+        headers={'Authorization': 'Bearer token'},
+        backoff_factor=0,
+        transport=httpx.MockTransport(handler)
+    )
+
+
+def test_http_publisher_retries_gateway_errors():
+    """Test that a 503 is retried and a later 200 counts as success."""
+    requests = []
+    publisher = make_publisher([503, 200], requests)
+    
+    assert asyncio.run(publisher.publish(make_event())) == True
+    assert len(requests) == 2
+    assert requests[0].headers['Content-Type'] == 'application/json'
+    assert requests[0].headers['Authorization'] == 'Bearer token'
+    assert b'"type":"pr.opened"' in requests[0].content
+
+
+def test_http_publisher_gives_up_after_max_retries():
+    """Test that persistent gateway errors fail after max_retries + 1 attempts."""
+    requests = []
+    publisher = make_publisher([502] * 10, requests)
+    
+    assert asyncio.run(publisher.publish(make_event())) == False
+    assert len(requests) == publisher.max_retries + 1
+
+
+def test_http_publisher_does_not_retry_client_errors():
+    """Test that non-gateway errors fail without retrying."""
+    requests = []
+    publisher = make_publisher([400, 200], requests)
+    
+    assert asyncio.run(publisher.publish(make_event())) == False
+    assert len(requests) == 1
+
+
+def test_multi_publisher_runs_publishers_concurrently():
+    """Test that latency tracks the slowest publisher, not the sum."""
+    publisher = MultiPublisher([SleepingPublisher(0.2), SleepingPublisher(0.2)])
+    
+    start = time.perf_counter()
+    assert asyncio.run(publisher.publish(make_event())) == True
+    assert time.perf_counter() - start < 0.35
+
+
+def test_multi_publisher_fails_if_any_publisher_fails():
+    """Test that a single False result fails the whole publish."""
+    publisher = MultiPublisher([SleepingPublisher(0.01), SleepingPublisher(0.02, result=False)])
+    
+    assert asyncio.run(publisher.publish(make_event())) == False
@@ -0,0 +1,108 @@
+"""Unit tests for event publishing tasks."""
+
+import asyncio
+import json
+from unittest import mock
+
+import msgspec
+import pytest
+
+from src.event_bus import tasks
+from src.event_bus.publisher import EventPublisher, MessageQueuePublisher, MultiPublisher
+from src.event_bus.schema import (
+    StandardEvent,
+    EventType,
+    EventMetadata,
+    Actor,
+    Repository,
+    Change,
+    ChangeType
+)
+
+
+def test_parse_event_queues():
+    """Test parsing of CELERY_EVENT_QUEUES values."""
+    queues = tasks._parse_event_queues(' deployment = webhooks-priority ,pr.merged=merges,bogus,')
+    
+    assert queues == {'deployment': 'webhooks-priority', 'pr.merged': 'merges'}
+    assert tasks._parse_event_queues('') == {}
+
+
+def test_queue_for_fallback_order(monkeypatch):
+    """Test exact type, then category, then default queue routing."""
+    monkeypatch.setattr(tasks, 'EVENT_QUEUES', {
+        'pr.merged': 'merges',
+        'pr': 'pull-requests',
+        'deployment': 'webhooks-priority'
+    })
+    
+    assert tasks.queue_for(EventType.PR_MERGED) == 'merges'
+    assert tasks.queue_for(EventType.PR_OPENED) == 'pull-requests'
+    assert tasks.queue_for(EventType.DEPLOYMENT_FAILED) == 'webhooks-priority'
+    assert tasks.queue_for(EventType.CODE_PUSH) == tasks.DEFAULT_QUEUE
+
+
+def test_rebuild_event_round_trip():
+    """Test that an event survives JSON task serialization."""
+    event = StandardEvent(
+        id='test-delivery-id',
+        type=EventType.CODE_PUSH,
+        source='github',
+        timestamp='2026-02-27T21:54:00Z',
+        actor=Actor(id='1', username='testuser'),
+        repository=Repository(
+            id='123',
+            name='test-repo',
+            full_name='testuser/test-repo',
+            owner='testuser',
+            url='https://github.com/testuser/test-repo'
+        ),
+        metadata=EventMetadata(ref='refs/heads/main', labels=['bug']),
+        changes=[Change(
+            type=ChangeType.COMMIT,
+            id='def456',
+            author=Actor(id='', username='testuser'),
+            files_added=['file1.txt']
+        )]
+    )
+    
+    rebuilt = tasks.rebuild_event(json.loads(json.dumps(event.to_dict())))
+    
+    # Empty file lists come back as [] rather than (), so compare the wire form
+    assert msgspec.json.encode(rebuilt) == msgspec.json.encode(event)
+    assert rebuilt.type is EventType.CODE_PUSH
+    assert rebuilt.changes[0].type is ChangeType.COMMIT
+
+
+class SlowPublisher(EventPublisher):
+    """Publisher that succeeds after a short delay."""
+    
+    async def publish(self, event):
+        await asyncio.sleep(0.05)
+        return True
+
+
+def test_publish_event_raising_publisher_is_retryable():
+    """Test that a raising publisher fails the task without leaking sibling tasks."""
+    event = StandardEvent(
+        id='test-delivery-id',
+        type=EventType.PR_OPENED,
+        source='github',
+        timestamp='2026-02-27T21:54:00Z',
+        actor=Actor(id='1', username='testuser'),
+        repository=Repository(
+            id='123',
+            name='test-repo',
+            full_name='testuser/test-repo',
+            owner='testuser',
+            url='https://github.com/testuser/test-repo'
+        ),
+        metadata=EventMetadata()
+    )
+    publisher = MultiPublisher([MessageQueuePublisher({}), SlowPublisher()])
+    
+    with mock.patch.object(tasks, 'get_event_publisher', return_value=publisher):
+        with pytest.raises(tasks.PublishError):
+            tasks.publish_event(event.to_dict())
+    
+    assert not asyncio.all_tasks(tasks._runner.get_loop())